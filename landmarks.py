@@ -0,0 +1,171 @@
+import numpy as np
+from pathfinding import dijkstra
+
+# ALT (A*, Landmarks, Triangle inequality) preprocessing.
+# For a static map we pick a handful of landmark cells offline and store the
+# cost from each landmark to every cell. At query time the triangle
+# inequality turns those tables into a lower bound on the remaining cost,
+# which is much tighter than an admissible Manhattan bound on weighted
+# terrain. Tables are stored cell-major, shape (rows, cols, count), so the
+# landmark distances of one cell are contiguous (one page of a memory map).
+
+def _lower_bounds(distances, cost_grid, source):
+    """Best landmark lower bound on the cost from source to every cell."""
+    # Entering a cell costs its own value, so d(x, L) = d(L, x) - c[x] + c[L]
+    # and a single table per landmark covers both directions.
+    at_source = distances[:, source[0], source[1]][:, None, None]
+    forward = distances - at_source
+    backward = at_source - distances - cost_grid[source] + cost_grid
+    bound = np.maximum(forward, backward).max(axis=0)
+    return np.maximum(bound, 0.0)
+
+def _shortest_path_tree(dist):
+    """Parent of every cell in the shortest path tree behind dist."""
+    padded = np.pad(dist, 1, constant_values=np.inf)
+    neighbors = np.stack([
+        padded[:-2, 1:-1],  # up
+        padded[2:, 1:-1],   # down
+        padded[1:-1, :-2],  # left
+        padded[1:-1, 2:],   # right
+    ])
+    choice = neighbors.argmin(axis=0)
+    rows, cols = np.indices(dist.shape)
+    offsets = np.array([(-1, 0), (1, 0), (0, -1), (0, 1)])
+    parent_r = rows + offsets[choice, 0]
+    parent_c = cols + offsets[choice, 1]
+    return parent_r * dist.shape[1] + parent_c
+
+def _select_farthest(cost_grid, count, rng):
+    """Repeatedly pick the cell farthest from the landmarks chosen so far."""
+    rows, cols = cost_grid.shape
+    seed_cell = (int(rng.integers(rows)), int(rng.integers(cols)))
+    nearest = dijkstra(cost_grid, seed_cell)
+
+    landmarks, distances = [], []
+    for _ in range(count):
+        flat = int(np.argmax(np.where(np.isfinite(nearest), nearest, -1)))
+        landmark = divmod(flat, cols)
+        if landmark in landmarks:
+            break  # Every reachable cell is already a landmark.
+        dist = dijkstra(cost_grid, landmark)
+        landmarks.append(landmark)
+        distances.append(dist)
+        nearest = dist if len(landmarks) == 1 else np.minimum(nearest, dist)
+    return landmarks, distances
+
+def _select_avoid(cost_grid, count, rng):
+    """Goldberg-Harrelson "avoid" selection.
+
+    Grows a shortest path tree from a random root, weights each cell by how
+    badly the current landmarks bound it, and walks down the heaviest
+    landmark-free subtree to a leaf, which becomes the next landmark.
+    """
+    rows, cols = cost_grid.shape
+    landmarks, distances = _select_farthest(cost_grid, 1, rng)
+    # Roots come from the first landmark's component, which caps how many
+    # distinct landmarks the walk can find.
+    component = np.flatnonzero(np.isfinite(distances[0]))
+    count = min(count, len(component))
+
+    while len(landmarks) < count:
+        root = divmod(int(rng.choice(component)), cols)
+        dist = dijkstra(cost_grid, root)
+        reachable = np.isfinite(dist)
+        bound = _lower_bounds(np.stack(distances), cost_grid, root)
+        weight = np.where(reachable, dist - bound, 0.0).ravel()
+        parent = _shortest_path_tree(dist).ravel()
+        root_flat = root[0] * cols + root[1]
+
+        size = weight.copy()
+        blocked = np.zeros(rows * cols, dtype=bool)
+        for r, c in landmarks:
+            blocked[r * cols + c] = True
+
+        # Children before parents: accumulate subtree weights towards the root.
+        children = [[] for _ in range(rows * cols)]
+        for flat in np.argsort(dist, axis=None)[::-1]:
+            if flat == root_flat or not reachable.flat[flat]:
+                continue
+            up = parent[flat]
+            children[up].append(flat)
+            size[up] += size[flat]
+            blocked[up] |= blocked[flat]
+        size[blocked] = 0.0
+
+        current = root_flat
+        while True:
+            candidates = [child for child in children[current] if size[child] > 0]
+            if not candidates:
+                break
+            current = max(candidates, key=lambda child: size[child])
+
+        landmark = divmod(int(current), cols)
+        if landmark in landmarks:
+            continue
+        landmarks.append(landmark)
+        distances.append(dijkstra(cost_grid, landmark))
+    return landmarks, distances
+
+def build_landmarks(cost_grid, count=8, method="farthest", seed=None, dtype=np.float32):
+    """
+    Pick landmarks on a static cost grid and tabulate their distances.
+    Input: cost_grid, number of landmarks, selection method ("farthest" or "avoid")
+    Output: (list of landmark cells, array of shape (rows, cols, count))
+    """
+    if method not in ("farthest", "avoid"):
+        raise ValueError(f"Unknown landmark selection method: {method}")
+    if count < 1:
+        raise ValueError(f"Need at least one landmark, got count={count}")
+    rng = np.random.default_rng(seed)
+    select = _select_farthest if method == "farthest" else _select_avoid
+    landmarks, distances = select(cost_grid, count, rng)
+    return landmarks, np.stack(distances, axis=-1).astype(dtype)
+
+def save_landmarks(path, distances):
+    """Write landmark distance tables to a .npy file."""
+    np.save(path, distances)
+
+def load_landmarks(path, mmap_mode="r"):
+    """Load landmark distance tables, memory-mapped by default."""
+    return np.load(path, mmap_mode=mmap_mode)
+
+def alt_heuristic(distances, cost_grid):
+    """
+    Build an admissible ALT heuristic for pathfinding.a_star.
+    Input: landmark distance tables and the cost grid they were built from
+    Output: function h(a, b) bounding the cost from a to b from below
+    """
+    eps = 4 * float(np.finfo(distances.dtype).eps)
+    table = np.asarray(distances)  # plain ndarray view; still backed by the memory map
+    goal_cache = {}
+
+    # Plain floats: a_star calls this once per neighbour, so numpy's
+    # per-call overhead would outweigh the expansions saved.
+    def h(a, b):
+        goal = goal_cache.get(b)
+        if goal is None:
+            goal = (table[b[0], b[1]].tolist(), float(cost_grid[b]))
+            goal_cache[b] = goal
+        goal_dist, goal_cost = goal
+        forward = backward = -np.inf
+        largest = 0.0
+        for node, target in zip(table[a[0], a[1]].tolist(), goal_dist):
+            if target - node > forward:
+                forward = target - node
+            if node - target > backward:
+                backward = node - target
+            if node > largest:
+                largest = node
+            if target > largest:
+                largest = target
+        backward += goal_cost - float(cost_grid[a])
+        # Absorb rounding from compact storage so the bound never overestimates.
+        bound = (forward if forward > backward else backward) - eps * largest
+        # NaN (from unreachable cells) fails this test too and falls back to 0.
+        return bound if bound > 0.0 else 0.0
+
+    return h
+
+if __name__ == "__main__":
+    print("This is the ALT landmark preprocessing module.")
+    print("Build tables once with build_landmarks, then pass alt_heuristic(...) to a_star.")
@@ -1,7 +1,10 @@
 import pygame
 import sys
-from maze import generate_maze, load_terrain_images, assign_costs_to_grid
+import random
+from maze import load_terrain_images
+from world import TiledWorld
 from pathfinding import a_star
+from landmarks import build_landmarks, alt_heuristic
 
 pygame.init()
 
@@ -384,8 +387,12 @@ def run_pathfinding_game():
         return None
     
     # Initialize game state
-    maze = generate_maze(ROWS, COLS)
-    cost_grid = assign_costs_to_grid(maze)
+    # The board is a viewport onto a streamed world; only its tiles are generated.
+    world = TiledWorld(seed=random.randrange(2**32))
+    maze = world.terrain_window(0, 0, ROWS, COLS)
+    cost_grid = world.cost_window(0, 0, ROWS, COLS)
+    _, landmark_tables = build_landmarks(cost_grid)
+    path_heuristic = alt_heuristic(landmark_tables, cost_grid)
     start = None
     goal = None
     path = None
@@ -425,7 +432,7 @@ def run_pathfinding_game():
                         selecting_mode = None
                         # Calculate path
                         if start and goal:
-                            path = a_star(maze, cost_grid, start, goal)
+                            path = a_star(maze, cost_grid, start, goal, path_heuristic)
                             character_pos = None
                             path_index = 0
                             animation_started = False
@@ -440,8 +447,11 @@ def run_pathfinding_game():
                 
                 if event.key == pygame.K_r:
                     # Regenerate maze
-                    maze = generate_maze(ROWS, COLS)
-                    cost_grid = assign_costs_to_grid(maze)
+                    world = TiledWorld(seed=random.randrange(2**32))
+                    maze = world.terrain_window(0, 0, ROWS, COLS)
+                    cost_grid = world.cost_window(0, 0, ROWS, COLS)
+                    _, landmark_tables = build_landmarks(cost_grid)
+                    path_heuristic = alt_heuristic(landmark_tables, cost_grid)
                     start = None
                     goal = None
                     path = None
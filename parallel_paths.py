@@ -0,0 +1,154 @@
+import heapq
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathfinding import dijkstra
+
+# Tile-partitioned single-source shortest paths.
+# The grid is split into square tiles. Each round, every "dirty" tile runs a
+# local Dijkstra seeded from its neighbours' boundary values and writes back
+# any improvements; tiles next to an improved tile become dirty for the next
+# round. Costs and distances live in shared memory so workers exchange tile
+# boundaries without copying whole grids, and the result matches the serial
+# pathfinding.dijkstra exactly.
+
+_shared = {}
+
+def _attach(cost_name, dist_name, shape):
+    """Pool initializer: map the shared cost and distance grids."""
+    for key, name in (("cost", cost_name), ("dist", dist_name)):
+        block = shared_memory.SharedMemory(name=name)
+        _shared[key + "_block"] = block
+        _shared[key] = np.ndarray(shape, dtype=np.float64, buffer=block.buf)
+
+def _relax_tile(task):
+    """Run Dijkstra inside one tile, seeded from the halo. Returns True if it improved."""
+    (r0, r1, c0, c1), seed_all = task
+    cost, dist = _shared["cost"], _shared["dist"]
+    rows, cols = cost.shape
+
+    block = dist[r0:r1, c0:c1].copy()
+    tile_cost = cost[r0:r1, c0:c1]
+
+    # Boundary exchange: pull in whatever the neighbouring tiles have reached.
+    improved = np.zeros(block.shape, dtype=bool)
+    halos = []
+    if r0 > 0:
+        halos.append((np.s_[0, :], dist[r0 - 1, c0:c1]))
+    if r1 < rows:
+        halos.append((np.s_[-1, :], dist[r1, c0:c1]))
+    if c0 > 0:
+        halos.append((np.s_[:, 0], dist[r0:r1, c0 - 1]))
+    if c1 < cols:
+        halos.append((np.s_[:, -1], dist[r0:r1, c1]))
+    for edge, halo in halos:
+        candidate = halo + tile_cost[edge]
+        better = candidate < block[edge]
+        block[edge] = np.where(better, candidate, block[edge])
+        improved[edge] |= better
+
+    seeds = np.isfinite(block) if seed_all else improved
+    if not seeds.any():
+        return False
+
+    # Plain lists keep the inner loop out of numpy's per-element overhead.
+    height, width = block.shape
+    local = block.ravel().tolist()
+    weight = tile_cost.ravel().tolist()
+    open_set = [(local[i], i) for i in np.flatnonzero(seeds).tolist()]
+    heapq.heapify(open_set)
+
+    while open_set:
+        d, current = heapq.heappop(open_set)
+        if d > local[current]:
+            continue
+        r, c = divmod(current, width)
+        for neighbor, inside in ((current - width, r > 0), (current + width, r < height - 1),
+                                 (current - 1, c > 0), (current + 1, c < width - 1)):
+            if inside:
+                tentative = d + weight[neighbor]
+                if tentative < local[neighbor]:
+                    local[neighbor] = tentative
+                    heapq.heappush(open_set, (tentative, neighbor))
+
+    result = np.array(local).reshape(block.shape)
+    changed = result < dist[r0:r1, c0:c1]
+    if not changed.any():
+        return False
+    dist[r0:r1, c0:c1] = np.where(changed, result, dist[r0:r1, c0:c1])
+    return True
+
+def parallel_dijkstra(cost_grid, source, tile_size=256, workers=None):
+    """
+    Cost of the cheapest path from source to every cell, computed on a process pool.
+    Input: cost_grid, source cell, tile edge length, number of worker processes
+    Output: distance grid (same values as pathfinding.dijkstra)
+    """
+    workers = workers or os.cpu_count() or 1
+    rows, cols = cost_grid.shape
+    tile_rows = -(-rows // tile_size)
+    tile_cols = -(-cols // tile_size)
+    if workers <= 1 or tile_rows * tile_cols == 1:
+        return dijkstra(cost_grid, source)
+
+    nbytes = rows * cols * np.dtype(np.float64).itemsize
+    cost_block = shared_memory.SharedMemory(create=True, size=nbytes)
+    dist_block = shared_memory.SharedMemory(create=True, size=nbytes)
+    try:
+        cost = np.ndarray((rows, cols), dtype=np.float64, buffer=cost_block.buf)
+        dist = np.ndarray((rows, cols), dtype=np.float64, buffer=dist_block.buf)
+        cost[:] = cost_grid
+        dist[:] = np.inf
+        dist[source] = 0.0
+
+        def bounds(tile):
+            tr, tc = tile
+            return (tr * tile_size, min((tr + 1) * tile_size, rows),
+                    tc * tile_size, min((tc + 1) * tile_size, cols))
+
+        first = (source[0] // tile_size, source[1] // tile_size)
+        dirty = {first}
+        seed_all = True
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach,
+                                 initargs=(cost_block.name, dist_block.name, (rows, cols))) as pool:
+            while dirty:
+                tiles = sorted(dirty)
+                tasks = [(bounds(tile), seed_all) for tile in tiles]
+                chunksize = max(1, len(tasks) // (workers * 4))
+                dirty = set()
+                for tile, changed in zip(tiles, pool.map(_relax_tile, tasks, chunksize=chunksize)):
+                    if not changed:
+                        continue
+                    tr, tc = tile
+                    for nr, nc in ((tr - 1, tc), (tr + 1, tc), (tr, tc - 1), (tr, tc + 1)):
+                        if 0 <= nr < tile_rows and 0 <= nc < tile_cols:
+                            dirty.add((nr, nc))
+                seed_all = False
+        return dist.copy()
+    finally:
+        cost_block.close()
+        cost_block.unlink()
+        dist_block.close()
+        dist_block.unlink()
+
+def parallel_path(grid, cost_grid, start, goal, tile_size=256, workers=None):
+    """Cheapest path from start to goal using parallel_dijkstra; same interface as a_star."""
+    dist = parallel_dijkstra(cost_grid, start, tile_size, workers)
+    if not np.isfinite(dist[goal]):
+        return None  # No path found
+
+    rows, cols = dist.shape
+    path = [goal]
+    current = goal
+    while current != start:
+        # A cheapest predecessor is always the neighbour with the smallest distance.
+        neighbors = [(current[0] + dx, current[1] + dy) for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]]
+        current = min((n for n in neighbors if 0 <= n[0] < rows and 0 <= n[1] < cols),
+                      key=lambda n: dist[n])
+        path.append(current)
+    return path[::-1]
+
+if __name__ == "__main__":
+    print("This is the parallel shortest-path module.")
+    print("Use parallel_dijkstra or parallel_path for single very large queries.")
@@ -5,15 +5,19 @@ def heuristic(a, b):
     """Manhattan distance heuristic for grid navigation."""
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
-def a_star(grid, cost_grid, start, goal):
-    """A* pathfinding algorithm."""
+def a_star(grid, cost_grid, start, goal, heuristic_fn=heuristic):
+    """A* pathfinding algorithm.
+
+    heuristic_fn(a, b) estimates the cost from a to b; pass a tighter one
+    (e.g. landmarks.alt_heuristic) to expand fewer nodes.
+    """
     rows, cols = grid.shape
     open_set = []
     heapq.heappush(open_set, (0, start))
 
     came_from = {}
     g_score = {start: 0}
-    f_score = {start: heuristic(start, goal)}
+    f_score = {start: heuristic_fn(start, goal)}
 
     while open_set:
         _, current = heapq.heappop(open_set)
@@ -30,7 +34,7 @@ def a_star(grid, cost_grid, start, goal):
                 if neighbor not in g_score or tentative_g < g_score[neighbor]:
                     came_from[neighbor] = current
                     g_score[neighbor] = tentative_g
-                    f_score[neighbor] = tentative_g + heuristic(neighbor, goal)
+                    f_score[neighbor] = tentative_g + heuristic_fn(neighbor, goal)
                     heapq.heappush(open_set, (f_score[neighbor], neighbor))
 
     return None  # No path found
@@ -43,6 +47,33 @@ def reconstruct_path(came_from, current):
         path.append(current)
     return path[::-1]
 
+def dijkstra(cost_grid, source):
+    """Cost of the cheapest path from source to every cell.
+
+    Uses the same move model as a_star: entering a cell costs its
+    cost_grid value. Unreachable cells are left at infinity.
+    """
+    rows, cols = cost_grid.shape
+    dist = np.full((rows, cols), np.inf)
+    dist[source] = 0.0
+    open_set = [(0.0, source)]
+
+    while open_set:
+        d, current = heapq.heappop(open_set)
+        if d > dist[current]:
+            continue
+
+        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+            neighbor = (current[0] + dx, current[1] + dy)
+
+            if 0 <= neighbor[0] < rows and 0 <= neighbor[1] < cols:
+                tentative = d + cost_grid[neighbor]
+                if tentative < dist[neighbor]:
+                    dist[neighbor] = tentative
+                    heapq.heappush(open_set, (tentative, neighbor))
+
+    return dist
+
 # If you want to test this file independently, use this:
 if __name__ == "__main__":
     # Test code only runs when this file is executed directly
@@ -0,0 +1,100 @@
+import pandas as pd
+import numpy as np
+import os
+import sys
+import joblib
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier
+
+# Out-of-core training for terrain datasets too large for model.py.
+# The CSV is read in chunks with typed columns; the scaler is fitted
+# incrementally and a fixed-size uniform sample (reservoir sampling) of rows
+# is kept for the random forests, so peak memory depends on chunk_size and
+# sample_size, not on the number of rows in the file.
+
+def read_chunks(path, chunk_size=100_000):
+    """
+    Stream a terrain CSV in chunks with compact column types.
+    Output: iterator of DataFrames (features as float32, terrain as category)
+    """
+    header = pd.read_csv(path, nrows=0).columns
+    dtypes = {col: np.float32 for col in header if col != 'terrain'}
+    dtypes['terrain'] = 'category'
+    return pd.read_csv(path, dtype=dtypes, chunksize=chunk_size)
+
+def train_streaming(path, chunk_size=100_000, sample_size=200_000, n_estimators=100, random_state=42):
+    """
+    Train the terrain classifier and difficulty regressor in one pass over a CSV.
+    Output: (classifier, regressor, scaler, label_encoder, feature_cols)
+    """
+    rng = np.random.default_rng(random_state)
+    scaler = StandardScaler()
+    labels = set()
+    feature_cols = None
+    sample_X = sample_terrain = sample_difficulty = None
+    seen = 0
+
+    for chunk in read_chunks(path, chunk_size):
+        if chunk.empty:
+            continue
+        if feature_cols is None:
+            feature_cols = [col for col in chunk.columns if col not in ['terrain', 'difficulty']]
+            sample_X = np.empty((sample_size, len(feature_cols)), dtype=np.float32)
+            sample_terrain = np.empty(sample_size, dtype=object)
+            sample_difficulty = np.empty(sample_size, dtype=np.float32)
+
+        X = chunk[feature_cols].to_numpy(dtype=np.float32)
+        terrain = chunk['terrain'].astype(str).to_numpy()
+        difficulty = chunk['difficulty'].to_numpy(dtype=np.float32)
+        scaler.partial_fit(X)
+        labels.update(chunk['terrain'].cat.categories)
+
+        # Reservoir sampling: fill the sample first, then replace slots at random
+        # so every row seen so far is kept with equal probability.
+        fill = min(max(sample_size - seen, 0), len(X))
+        sample_X[seen:seen + fill] = X[:fill]
+        sample_terrain[seen:seen + fill] = terrain[:fill]
+        sample_difficulty[seen:seen + fill] = difficulty[:fill]
+
+        positions = np.arange(seen + fill, seen + len(X))
+        slots = rng.integers(0, positions + 1) if len(positions) else positions
+        keep = slots < sample_size
+        rows = np.arange(fill, len(X))[keep]
+        slots = slots[keep]
+        # A slot hit twice in one chunk must end up with the later row, and all
+        # three arrays must agree on it, so resolve duplicates before assigning.
+        slots, last = np.unique(slots[::-1], return_index=True)
+        rows = rows[::-1][last]
+        sample_X[slots] = X[rows]
+        sample_terrain[slots] = terrain[rows]
+        sample_difficulty[slots] = difficulty[rows]
+        seen += len(X)
+
+    if feature_cols is None or seen == 0:
+        raise ValueError(f"No rows found in {path}")
+    kept = min(seen, sample_size)
+    X_scaled = scaler.transform(sample_X[:kept])
+
+    label_encoder = LabelEncoder()
+    label_encoder.fit(sorted(labels))
+    y_class = label_encoder.transform(sample_terrain[:kept])
+
+    clf = RandomForestClassifier(n_estimators=n_estimators, random_state=random_state)
+    clf.fit(X_scaled, y_class)
+
+    reg = RandomForestRegressor(n_estimators=n_estimators, random_state=random_state)
+    reg.fit(X_scaled, sample_difficulty[:kept])
+
+    return clf, reg, scaler, label_encoder, feature_cols
+
+# Run directly to train on a large CSV and save models in the same layout as model.py
+if __name__ == "__main__":
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else 'terrain_datasetC1.csv'
+    clf, reg, scaler, label_encoder, feature_cols = train_streaming(csv_path)
+
+    os.makedirs("models", exist_ok=True)
+    joblib.dump(clf, "models/terrain_classifier.pkl")
+    joblib.dump(reg, "models/difficulty_regressor.pkl")
+    joblib.dump(scaler, "models/feature_scaler.pkl")
+    joblib.dump(label_encoder, "models/label_encoder.pkl")
+    print(f"Trained on {csv_path} with features: {', '.join(feature_cols)}")
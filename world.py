@@ -0,0 +1,123 @@
+import heapq
+from collections import OrderedDict
+import numpy as np
+from maze import terrains, terrain_types
+from pathfinding import reconstruct_path
+
+# Procedurally streamed world.
+# Terrain is generated tile by tile from (seed, tile coordinate), so any tile
+# can be rebuilt identically at any time and only recently used tiles need to
+# stay in memory. Coordinates are unbounded (negative ones included).
+
+_difficulty = np.array([terrain_types[t]["difficulty"] for t in terrains])
+_min_difficulty = float(_difficulty.min())
+_names = np.array(terrains)
+
+def _zigzag(n):
+    """Map any integer to a non-negative one (0, -1, 1, -2, ... -> 0, 1, 2, 3, ...)."""
+    return 2 * n if n >= 0 else -2 * n - 1
+
+class TiledWorld:
+    """Unbounded terrain grid built from fixed-size tiles held in an LRU cache."""
+
+    def __init__(self, seed=0, tile_size=64, max_bytes=64 * 1024 * 1024):
+        if not isinstance(seed, (int, np.integer)) or isinstance(seed, bool):
+            raise TypeError(f"World seed must be an integer, got {seed!r}")
+        self.seed = int(seed)
+        self.tile_size = tile_size
+        self.max_bytes = max_bytes
+        self._tiles = OrderedDict()
+        self._bytes = 0
+
+    def _cached(self, key, build):
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+            return tile
+
+        tile = build()
+        self._tiles[key] = tile
+        self._bytes += tile.nbytes
+        # Always keep the tile just built, even if it alone exceeds the budget.
+        while self._bytes > self.max_bytes and len(self._tiles) > 1:
+            _, evicted = self._tiles.popitem(last=False)
+            self._bytes -= evicted.nbytes
+        return tile
+
+    def terrain_tile(self, tr, tc):
+        """Terrain indices (into maze.terrains) for one tile."""
+        def build():
+            rng = np.random.default_rng([_zigzag(self.seed), _zigzag(tr), _zigzag(tc)])
+            size = (self.tile_size, self.tile_size)
+            return rng.integers(len(terrains), size=size, dtype=np.uint8)
+        return self._cached(("terrain", tr, tc), build)
+
+    def cost_tile(self, tr, tc):
+        """Movement costs for one tile, derived from its terrain."""
+        return self._cached(("cost", tr, tc), lambda: _difficulty[self.terrain_tile(tr, tc)])
+
+    def cost_at(self, cell):
+        """Movement cost of a single cell."""
+        tr, r = divmod(cell[0], self.tile_size)
+        tc, c = divmod(cell[1], self.tile_size)
+        return float(self.cost_tile(tr, tc)[r, c])
+
+    def _window(self, tile_fn, top, left, rows, cols, dtype):
+        out = np.empty((rows, cols), dtype=dtype)
+        size = self.tile_size
+        for tr in range(top // size, (top + rows - 1) // size + 1):
+            for tc in range(left // size, (left + cols - 1) // size + 1):
+                r0, c0 = max(top, tr * size), max(left, tc * size)
+                r1, c1 = min(top + rows, (tr + 1) * size), min(left + cols, (tc + 1) * size)
+                tile = tile_fn(tr, tc)
+                out[r0 - top:r1 - top, c0 - left:c1 - left] = \
+                    tile[r0 - tr * size:r1 - tr * size, c0 - tc * size:c1 - tc * size]
+        return out
+
+    def terrain_window(self, top, left, rows, cols):
+        """Terrain names for a viewport, shaped like maze.generate_maze output."""
+        return _names[self._window(self.terrain_tile, top, left, rows, cols, np.uint8)]
+
+    def cost_window(self, top, left, rows, cols):
+        """Movement costs for a viewport, shaped like maze.assign_costs_to_grid output."""
+        return self._window(self.cost_tile, top, left, rows, cols, float)
+
+def world_heuristic(a, b):
+    """Manhattan distance scaled by the cheapest terrain, so it never overestimates."""
+    return _min_difficulty * (abs(a[0] - b[0]) + abs(a[1] - b[1]))
+
+def world_a_star(world, start, goal, heuristic_fn=world_heuristic, max_expansions=None):
+    """
+    A* over a TiledWorld, loading only the tiles the search touches.
+    The default heuristic keeps routes optimal; pass pathfinding.heuristic
+    for a faster, weighted search.
+    Input: world, start and goal cells, optional expansion limit
+    Output: path as a list of cells, or None if the limit was hit
+    """
+    open_set = []
+    heapq.heappush(open_set, (0, start))
+
+    came_from = {}
+    g_score = {start: 0}
+    expansions = 0
+
+    while open_set:
+        _, current = heapq.heappop(open_set)
+
+        if current == goal:
+            return reconstruct_path(came_from, current)
+
+        expansions += 1
+        if max_expansions is not None and expansions > max_expansions:
+            break
+
+        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:  # 4 directions
+            neighbor = (current[0] + dx, current[1] + dy)
+            tentative_g = g_score[current] + world.cost_at(neighbor)
+
+            if neighbor not in g_score or tentative_g < g_score[neighbor]:
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g
+                heapq.heappush(open_set, (tentative_g + heuristic_fn(neighbor, goal), neighbor))
+
+    return None  # No path found within the limit